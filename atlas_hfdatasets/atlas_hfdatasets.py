@@ -17,6 +17,25 @@ except ImportError:
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s', datefmt='%H:%M:%S')
 
+# Every subcommand except init needs a logged in user, handlers receive the parsed args and username
+COMMAND_HANDLERS = {
+    'upload': lambda args, username: upload_dataset(args.dataset_pattern, args.repo_name),
+    'list': lambda args, username: list_datasets(args.f, username),
+    'remove': lambda args, username: remove_dataset(args.repo_name, args.f),
+    'download': lambda args, username: download_dataset(
+        args.repo_name, args.o,
+        max_workers=args.workers,
+        num_proc=args.num_proc,
+        streaming=args.streaming,
+        accelerate=not args.no_accel,
+        force=args.force,
+        cache_only=args.cache_only,
+    ),
+    'check': lambda args, username: check_dataset(args.repo_name, args.streaming),
+    'create': lambda args, username: create_dataset(args.repo_name, args.p),
+    'rename': lambda args, username: rename_dataset(args.repo_name, args.new_repo_name),
+}
+
 def main():
     logo=r'''
           _   _             ____  _       _        __
@@ -51,18 +70,27 @@ def main():
     download_parser = subparsers.add_parser('download', help='Download dataset from Hugging Face Hub')
     download_parser.add_argument('repo_name', type=str, help='Repository name to download (format: username/repo_name)')
     download_parser.add_argument('-o', type=str, help='Output directory path', default="./")
+    download_parser.add_argument('-w', '--workers', type=int, help='Number of configurations to download concurrently (default: 8)', default=8)
+    download_parser.add_argument('-j', '--num-proc', type=int, help='Number of processes used to download shards of each configuration (default: single process). '
+                                 'Values above 1 download configurations one at a time, -w is ignored', default=None)
+    download_parser.add_argument('-s', '--streaming', action='store_true', help='Stream and preview each configuration without saving it to disk')
+    download_parser.add_argument('--no-accel', action='store_true', help='Disable hf_transfer and hf_xet high performance downloads (useful for diagnosing errors)')
+    download_parser.add_argument('-f', '--force', action='store_true', help='Download all configurations again, even those already saved from the latest commit')
+    download_parser.add_argument('-c', '--cache-only', action='store_true', help='Keep only the Hugging Face cache in the output directory and skip save_to_disk. '
+                                 'Faster and half the disk writes, but load it with load_dataset(repo_name, config, cache_dir=path) '
+                                 'instead of load_from_disk(path)')
 
     upload_parser = subparsers.add_parser('upload', help='Upload dataset to Hugging Face Hub')
     upload_parser.add_argument('dataset_pattern', type=str, help='Dataset pattern to match datasets')
     upload_parser.add_argument('repo_name', type=str, help='Repository name for upload (format: username/repo_name). Default is the dataset folder name', default=None)
-    upload_parser.add_argument('-p', type=bool, help='Make dataset public (default: False)', default=False)
     
     remove_parser = subparsers.add_parser('remove', help='Remove dataset from Hugging Face Hub')
     remove_parser.add_argument('repo_name', type=str, help='Repository name to remove (format: username/repo_name)')
-    remove_parser.add_argument('-f', action='store_true', help='Force deletion without confirmation')
+    remove_parser.add_argument('-f', '--yes', dest='f', action='store_true', help='Force deletion without confirmation (or set ATLAS_HF_ASSUME_YES=1)')
     
     check_parser = subparsers.add_parser('check', help='Check dataset statistics from Hugging Face Hub')
     check_parser.add_argument('repo_name', type=str, help='Repository name to check (format: username/repo_name)')
+    check_parser.add_argument('-s', '--streaming', action='store_true', help='Stream and print the first example of each configuration')
 
     rename_parser = subparsers.add_parser('rename', help='Rename dataset on Hugging Face Hub')
     rename_parser.add_argument('repo_name', type=str, help='Repository name to rename (format: username/repo_name)')
@@ -70,28 +98,17 @@ def main():
 
     args = parser.parse_args()
 
-    command_handlers = {
-        'upload': lambda: upload_dataset(args.dataset_pattern, args.repo_name, args.p),
-        'list': lambda: list_datasets(args.f, username),
-        'remove': lambda: remove_dataset(args.repo_name, args.f),
-        'download': lambda: download_dataset(args.repo_name, args.o),
-        'check': lambda: check_dataset(args.repo_name),
-        'create': lambda: create_dataset(args.repo_name, args.p),
-        'rename': lambda: rename_dataset(args.repo_name, args.new_repo_name)
-    }
-
     if args.command == 'init':
         login_to_hub()
-    else:
+    elif args.command in COMMAND_HANDLERS:
         try:
             username = get_username()
         except:
             logging.error("Please login first by running 'atlas_hgdatasets init'")
             sys.exit(1)
-        if args.command in command_handlers:
-            command_handlers[args.command]()
-        else:
-            parser.print_help()
+        COMMAND_HANDLERS[args.command](args, username)
+    else:
+        parser.print_help()
 
 if __name__ == "__main__":
     main()
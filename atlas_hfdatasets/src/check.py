@@ -1,10 +1,19 @@
-def check_dataset(repo_name):
+try:
+    from src.core_functions import get_api, get_config_names
+except ImportError:
+    from atlas_hfdatasets.src.core_functions import get_api, get_config_names
+
+
+def check_dataset(repo_name, streaming=False):
     """
     Check dataset statistics from Hugging Face Hub
+
+    Args:
+        repo_name (str): Repository name in format username/repo_name
+        streaming (bool): Also stream the first example of each configuration
     """
 
-    from huggingface_hub import HfApi
-    api = HfApi()
+    api = get_api()
 
     dataset_info = api.dataset_info(repo_name)
     
@@ -51,5 +60,13 @@ def check_dataset(repo_name):
     print("\n=== Files ===")
     for sibling in dataset_info.siblings:
         print(f"  - {sibling.rfilename}")
-    
 
+    if streaming:
+        try:
+            from src.download import preview_dataset
+        except ImportError:
+            from atlas_hfdatasets.src.download import preview_dataset
+
+        print("\n=== Preview ===")
+        for config in get_config_names(repo_name):
+            preview_dataset(repo_name, config)
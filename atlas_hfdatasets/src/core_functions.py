@@ -1,10 +1,83 @@
 import logging, argparse,os,sys
-from huggingface_hub import create_repo
+from functools import lru_cache
+
+# Hub requests failing with these statuses are retried with exponential backoff
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def _make_session():
+    """
+    Create a requests session with a large connection pool that retries transient Hub errors
+    
+    Returns:
+        requests.Session: The configured session
+    """
+    import requests
+    from urllib3.util.retry import Retry
+    try:
+        # Private in huggingface_hub, adds the request IDs the Hub uses in error messages
+        from huggingface_hub.utils._http import UniqueRequestIdAdapter as HTTPAdapter
+    except ImportError:
+        from requests.adapters import HTTPAdapter
+
+    # raise_on_status=False hands the last response back to huggingface_hub, so failures
+    # still surface as HfHubHTTPError with the Hub's message instead of a bare RetryError
+    retries = Retry(total=5, backoff_factor=0.5, status_forcelist=RETRY_STATUSES, raise_on_status=False)
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def configure_http_backend():
+    """
+    Make huggingface_hub, and datasets which downloads through it, use retrying
+    pooled sessions. huggingface_hub keeps one session per thread from this factory.
+    The download timeout is raised to 30s unless HF_HUB_DOWNLOAD_TIMEOUT is set.
+    """
+    import huggingface_hub
+    from huggingface_hub import constants
+
+    # huggingface_hub>=1.0 replaced requests with httpx and dropped this hook
+    if hasattr(huggingface_hub, "configure_http_backend") and not constants.HF_HUB_OFFLINE:
+        huggingface_hub.configure_http_backend(backend_factory=_make_session)
+    constants.HF_HUB_DOWNLOAD_TIMEOUT = int(os.environ.setdefault("HF_HUB_DOWNLOAD_TIMEOUT", "30"))
+
+
+@lru_cache(maxsize=None)
+def get_api():
+    """
+    Get the HfApi client shared by all commands, so it is only created once per process
+    
+    Returns:
+        HfApi: The shared Hugging Face API client
+    """
+    from huggingface_hub import HfApi
+    configure_http_backend()
+    return HfApi(library_name="atlas_hfdatasets")
+
+
+@lru_cache(maxsize=128)
+def get_config_names(repo_name):
+    """
+    Get the configuration names of a dataset, cached to avoid repeated Hub requests
+    
+    Args:
+        repo_name (str): Repository name in format username/repo_name
+        
+    Returns:
+        tuple: Configuration names of the dataset
+    """
+    from datasets import get_dataset_config_names
+    configure_http_backend()
+    return tuple(get_dataset_config_names(repo_name))
+
 
 def login_to_hub():
     try:
-        from huggingface_hub import HfApi
-        api = HfApi()
+        api = get_api()
         user_info = api.whoami()
         print("\nSuccessfully logged in to Hugging Face Hub!")
         print(f"Welcome ({user_info['name']})")
@@ -25,8 +98,7 @@ def login_to_hub():
         try:
             login(token=token)
             print("Successfully logged in to Hugging Face Hub!")
-            from huggingface_hub import HfApi
-            api = HfApi()
+            api = get_api()
             user_info = api.whoami()
         except Exception as e:
             print(f"Login failed: {str(e)}")
@@ -68,26 +140,30 @@ def remove_dataset(repo_name, force=False):
     
     Args:
         repo_name (str): Name of the repository to remove (format: username/repo_name)
-        force (bool): Whether to force deletion without confirmation
+        force (bool): Whether to force deletion without confirmation. Also enabled by
+            setting the ATLAS_HF_ASSUME_YES=1 environment variable
     """
+    force = force or os.environ.get("ATLAS_HF_ASSUME_YES") == "1"
     
     logging.info(f"Removing dataset {repo_name} from Hugging Face Dataset Hub")
     try:
-        from huggingface_hub import HfApi
-        api = HfApi()
+        api = get_api()
         api.repo_info(repo_id=repo_name, repo_type="dataset")
         logging.info(f"Checked: Dataset repository {repo_name} exists")
     except Exception as e:
         logging.error(f"Dataset repository {repo_name} does not exist: {str(e)}")
         return
     if not force:
+        # Never block waiting for a confirmation that cannot be typed (pipes, xargs, CI)
+        if not sys.stdin.isatty():
+            logging.error("Cannot confirm deletion without a terminal, use -f to delete without confirmation")
+            return
         confirm = input(f"Are you sure you want to delete dataset {repo_name}? This cannot be undone. [y/N]: ")
         if confirm.lower() != 'y':
             logging.info("Deletion cancelled")
             return
             
-    from huggingface_hub import delete_repo
-    delete_repo(repo_name, repo_type="dataset")
+    api.delete_repo(repo_name, repo_type="dataset")
     logging.info(f"Dataset {repo_name} successfully removed")
 
 
@@ -100,7 +176,7 @@ def create_dataset(repo_name: str, public: bool = False) -> None:
         public (bool): Whether to make the dataset public (default: False)
     """
     try:
-        create_repo(
+        get_api().create_repo(
             repo_id=repo_name,
             repo_type="dataset",
             private=not public,
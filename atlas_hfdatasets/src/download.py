@@ -1,34 +1,224 @@
-import logging, os
+import logging, os, shutil
+import importlib.util
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed
+try:
+    from src.core_functions import get_api, get_config_names
+except ImportError:
+    from atlas_hfdatasets.src.core_functions import get_api, get_config_names
 
-def download_dataset(repo_name, output_dir):
+# Written next to each saved configuration, holds "<commit sha> <layout>" where layout is
+# "saved" (save_to_disk) or "cache" (--cache-only), a config is only skipped if both match
+REVISION_FILE = ".atlas_rev"
+
+logger = logging.getLogger(__name__)
+
+
+def configure_hf_transfer(enabled=True):
+    """
+    Switch huggingface_hub downloads to its accelerated Rust backends. Files stored with
+    LFS go through hf_transfer, which fetches each file over several parallel connections,
+    and files stored with Xet go through hf_xet in high performance mode. Disable them
+    when diagnosing download errors, their error messages are less helpful.
+
+    Args:
+        enabled (bool): Whether to use the accelerated backends when installed (default: True)
+    """
+    if enabled:
+        os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+    else:
+        os.environ["HF_XET_HIGH_PERFORMANCE"] = "0"
+
+    enabled = enabled and importlib.util.find_spec("hf_transfer") is not None
+    if enabled:
+        os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    else:
+        os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "0"
+
+    # huggingface_hub reads the variable at import time, update it if already loaded
+    from huggingface_hub import constants
+    constants.HF_HUB_ENABLE_HF_TRANSFER = os.environ["HF_HUB_ENABLE_HF_TRANSFER"].upper() in ("1", "ON", "YES", "TRUE")
+
+
+@contextmanager
+def _inner_progress_bars_disabled():
+    """
+    Hide the per-file progress bars of datasets and huggingface_hub, restoring them on exit,
+    so concurrent configuration downloads don't draw over the overall progress bar
+    """
+    import datasets
+    from huggingface_hub.utils import (
+        are_progress_bars_disabled, disable_progress_bars, enable_progress_bars,
+    )
+
+    datasets_bars = not datasets.are_progress_bars_disabled()
+    hub_bars = not are_progress_bars_disabled()
+    datasets.disable_progress_bars()
+    disable_progress_bars()
+    try:
+        yield
+    finally:
+        if datasets_bars:
+            datasets.enable_progress_bars()
+        if hub_bars:
+            enable_progress_bars()
+
+
+def _read_revision(output_path):
+    """
+    Get the "<commit sha> <layout>" stamp a saved configuration was downloaded with, or None
+    """
+    revision_path = os.path.join(output_path, REVISION_FILE)
+    if not os.path.isfile(revision_path):
+        return None
+    with open(revision_path, "r") as f:
+        return f.read().strip()
+
+
+def _fetch_one(repo_name, config, output_dir, num_proc=None, revision=None, force=False, cache_only=False):
+    """
+    Download a single configuration and save it to disk
+
+    Args:
+        repo_name (str): Repository name in format username/repo_name
+        config (str): Configuration name to download
+        output_dir (str): Local directory to save the dataset
+        num_proc (int): Number of processes used to download and save shards
+        revision (str): Repository commit to download. The download is skipped when the
+            configuration was already saved from this commit with the same layout
+        force (bool): Download even if the configuration is already up to date
+        cache_only (bool): Keep the Hugging Face cache in output_path instead of saving a copy
+
+    Returns:
+        str: Path the configuration was saved to
+    """
+    from datasets import load_dataset
+
+    output_path = os.path.join(output_dir, repo_name.split('/')[-1], config)
+    layout = 'cache' if cache_only else 'saved'
+    stamp = f"{revision} {layout}"
+    stored = _read_revision(output_path)
+    if not force and revision is not None and stored == stamp:
+        logger.debug("Configuration %s is up to date in %s, skipping", config, output_path)
+        return output_path
+
+    # Remove a copy saved with the other layout, otherwise load_from_disk could still open a
+    # stale saved copy next to the new cache, and the disk space would be used twice
+    if stored is not None and stored.split()[-1] != layout:
+        logger.debug("Removing %s, it was saved with a different layout", output_path)
+        shutil.rmtree(output_path)
+    elif stored is not None:
+        # Dropped first, so an interrupted download is never taken as complete
+        os.remove(os.path.join(output_path, REVISION_FILE))
+
+    logger.debug("Downloading configuration: %s", config)
+    if cache_only:
+        # The prepared Arrow cache is the final copy, no second pass through save_to_disk
+        load_dataset(repo_name, config, num_proc=num_proc, revision=revision,
+                     cache_dir=output_path, keep_in_memory=False)
+        os.makedirs(output_path, exist_ok=True)
+    else:
+        dataset = load_dataset(repo_name, config, num_proc=num_proc, revision=revision)
+
+        # Save dataset to disk
+        dataset.save_to_disk(output_path, num_proc=num_proc)
+    if revision is not None:
+        with open(os.path.join(output_path, REVISION_FILE), "w") as f:
+            f.write(stamp)
+    return output_path
+
+
+def preview_dataset(repo_name, config=None):
+    """
+    Stream a dataset configuration and print the features, row count and first example
+    of each split, without writing anything to disk
+
+    Args:
+        repo_name (str): Repository name in format username/repo_name
+        config (str): Configuration name to preview (default: the dataset default)
+    """
+    from datasets import load_dataset, IterableDataset
+
+    dataset = load_dataset(repo_name, config, streaming=True)
+    splits = {None: dataset} if isinstance(dataset, IterableDataset) else dataset
+
+    for split_name, split in splits.items():
+        print(f"\n=== {config or 'default'}" + (f" / {split_name}" if split_name else "") + " ===")
+        if split.info.features:
+            print("Features:")
+            for name, feature in split.info.features.items():
+                print(f"  - {name}: {feature}")
+        # Row counts come from the dataset metadata, iterating would download everything
+        split_info = (split.info.splits or {}).get(str(split.split))
+        if split_info is not None and split_info.num_examples:
+            print(f"Rows: {split_info.num_examples}")
+        first_example = next(iter(split), None)
+        print(f"First example: {first_example}")
+
+
+def download_dataset(repo_name, output_dir, max_workers=8, num_proc=None, streaming=False, accelerate=True, force=False, cache_only=False):
     """
     Download a dataset from Hugging Face Hub with all its configurations
     
     Args:
         repo_name (str): Repository name in format username/repo_name
         output_dir (str): Local directory to save the dataset
+        max_workers (int): Number of configurations to download concurrently (default: 8)
+        num_proc (int): Number of processes used to download and save the shards of
+            each configuration (default: None, a single process). When greater than 1,
+            configurations are downloaded one at a time, since datasets forks worker
+            processes and forking while other threads hold locks can deadlock them
+        streaming (bool): Only stream and preview each configuration, nothing is saved to disk
+        accelerate (bool): Download files with hf_transfer and hf_xet high performance mode (default: True)
+        force (bool): Download every configuration again, even those already saved from
+            the current repository commit (default: False)
+        cache_only (bool): Download each configuration straight into a Hugging Face cache in
+            its output directory and skip save_to_disk, avoiding a second full copy of the
+            data. Load it back with load_dataset(repo_name, config, cache_dir=path) instead of
+            load_from_disk(path) (default: False)
     """
-    logging.info(f"Downloading dataset from {repo_name}")
+    configure_hf_transfer(accelerate)
+    if num_proc is not None and num_proc > 1 and max_workers > 1:
+        logger.info("Downloading configurations one at a time since -j %d uses multiple processes", num_proc)
+        max_workers = 1
+
+    logger.info("Downloading dataset from %s", repo_name)
     try:
-        from datasets import load_dataset, get_dataset_config_names
-        
         # Get all available configs
-        configs = get_dataset_config_names(repo_name)
-        logging.info(f"Found {len(configs)} configurations")
+        configs = get_config_names(repo_name)
+        logger.info("Found %d configurations", len(configs))
+
+        if streaming:
+            for config in configs:
+                preview_dataset(repo_name, config)
+            return
         
+        from tqdm.auto import tqdm
+
+        # Configurations already saved from this commit are skipped unless forced
+        revision = get_api().dataset_info(repo_name).sha
+
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Download each configuration
-        for config in configs:
-            logging.info(f"Downloading configuration: {config}")
-            dataset = load_dataset(repo_name, config)
-            
-            # Save dataset to disk
-            output_path = os.path.join(output_dir, repo_name.split('/')[-1], config)
-            dataset.save_to_disk(output_path)
-            logging.info(f"Configuration {config} downloaded to {output_path}")
+        # Download configurations concurrently, downloads are network bound
+        with _inner_progress_bars_disabled(), ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_fetch_one, repo_name, config, output_dir, num_proc, revision, force, cache_only): config
+                for config in configs
+            }
+            try:
+                # One progress bar for all configurations instead of a log line per config
+                for future in tqdm(as_completed(futures), total=len(futures), desc=repo_name, unit="config"):
+                    config = futures[future]
+                    output_path = future.result()
+                    logger.debug("Configuration %s downloaded to %s", config, output_path)
+            except BaseException:
+                # Don't wait for the queued configurations before reporting the failure
+                for pending in futures:
+                    pending.cancel()
+                raise
             
     except Exception as e:
-        logging.error(f"Failed to download dataset: {str(e)}")
-        raise
\ No newline at end of file
+        logger.error("Failed to download dataset: %s", e)
+        raise
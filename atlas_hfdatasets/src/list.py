@@ -1,4 +1,7 @@
-
+try:
+    from src.core_functions import get_api, get_config_names
+except ImportError:
+    from atlas_hfdatasets.src.core_functions import get_api, get_config_names
 
 
 def list_datasets(keyword=None, username=None):
@@ -12,55 +15,57 @@ def list_datasets(keyword=None, username=None):
         username (str): Your Hugging Face username
     """
         
-    from huggingface_hub import HfApi
-    from datasets import get_dataset_config_names
     import re
-    api = HfApi()
+    api = get_api()
     try:
         logging.info("Retrieving dataset list from Hugging Face Hub...")
-        datasets = api.list_datasets(author=username)
+        datasets = list(api.list_datasets(author=username))
         if datasets:
-            # Filter datasets by keyword if provided
+            # Filter datasets by keyword if provided, plain keywords skip the regex engine
             if keyword:
-                pattern = re.compile(keyword, re.IGNORECASE)
-                datasets = [d for d in datasets if pattern.search(d.id)]
+                if keyword.isalnum():
+                    needle = keyword.lower()
+                    datasets = [d for d in datasets if needle in d.id.lower()]
+                else:
+                    search = re.compile(keyword, re.IGNORECASE).search
+                    datasets = [d for d in datasets if search(d.id)]
             
             if datasets:
-                print("\nFound following datasets on Hugging Face Hub:")
-                print("-" * 80)
+                lines = ["\nFound following datasets on Hugging Face Hub:", "-" * 80]
                 
                 if keyword:
                     # 详细显示带关键词过滤的数据集信息
+                    separator = "=" * 80
                     for dataset in datasets:
                         tags = ', '.join(dataset.tags) if dataset.tags else 'No tags'
-                        separator = "=" * 80
-                        
-                        print(f"\nDataset: {dataset.id}")
-                        print(f"Last Modified: {dataset.lastModified}")
-                        print(f"Downloads: {dataset.downloads}")
-                        print(f"Tags: {tags}")
+                        lines.extend([
+                            f"\nDataset: {dataset.id}",
+                            f"Last Modified: {dataset.lastModified}",
+                            f"Downloads: {dataset.downloads}",
+                            f"Tags: {tags}",
+                        ])
                         
                         try:
-                            configs = get_dataset_config_names(dataset.id)
-                            print("Configs:")
+                            configs = get_config_names(dataset.id)
+                            lines.append("Configs:")
                             if configs:
-                                for config in configs:
-                                    print(f"  - {config}")
+                                lines.extend(f"  - {config}" for config in configs)
                             else:
-                                print("  - No configs available")
+                                lines.append("  - No configs available")
                         except Exception:
-                            print("Configs: Error loading configs")
+                            lines.append("Configs: Error loading configs")
                         
-                        print(separator)
-                        print()
+                        lines.extend([separator, ""])
                 else:
                     # 只显示数据集名称列表
-                    for dataset in datasets:
-                        print(f"- {dataset.id}")
-                    print()
+                    lines.extend(f"- {dataset.id}" for dataset in datasets)
+                    lines.append("")
+
+                # Write the whole listing at once instead of one print per line
+                sys.stdout.write("\n".join(lines) + "\n")
             else:
                 print(f"\nNo matching datasets found for keyword '{keyword}'")
         else:
             print(f"\nNo datasets found for user {username} on Hugging Face Hub")
     except Exception as e:
-        logging.error(f"Error retrieving datasets: {str(e)}")
\ No newline at end of file
+        logging.error(f"Error retrieving datasets: {str(e)}")
@@ -1,5 +1,8 @@
 import logging
-from huggingface_hub import HfApi
+try:
+    from src.core_functions import get_api
+except ImportError:
+    from atlas_hfdatasets.src.core_functions import get_api
 
 def rename_dataset(repo_name, new_repo_name):
     """
@@ -12,7 +15,7 @@ def rename_dataset(repo_name, new_repo_name):
     logging.info(f"Renaming dataset from {repo_name} to {new_repo_name}")
     
     try:
-        api = HfApi()
+        api = get_api()
         # Check if source repo exists
         try:
             api.dataset_info(repo_name)
@@ -1,6 +1,17 @@
-import logging,os,json
-from src.core_functions import get_username
-from huggingface_hub import DatasetInfo
+import logging,os,json,math,glob,shutil
+try:
+    from src.core_functions import get_username, get_api
+except ImportError:
+    from atlas_hfdatasets.src.core_functions import get_username, get_api
+
+# Datasets are written as ~200MB parquet shards so they upload concurrently and
+# can be downloaded in parallel with load_dataset(..., num_proc=...). Datasets
+# larger than LARGE_DATASET_BYTES are sent with the resumable multi-part uploader.
+LARGE_DATASET_BYTES = 1024 ** 3
+SHARD_BYTES = 200 * 1024 ** 2
+UPLOAD_WORKERS = 8
+# Written in the shard folder once all shards exist, holds the fingerprint of the dataset
+SHARDS_MARKER = ".atlas_shards"
 
 
 def find_matching_datasets(dataset_pattern):
@@ -35,22 +46,186 @@ def find_matching_datasets(dataset_pattern):
     
     return matching_datasets
 
-def upload_dataset(dataset_pattern, repo_name=None, public=False):
+def _dataset_nbytes(dataset):
+    """
+    Estimate the in-memory size of a Dataset or DatasetDict in bytes
+    """
+    splits = dataset.values() if hasattr(dataset, 'values') else [dataset]
+    return sum(split.data.nbytes for split in splits)
+
+
+def _config_card(repo_name, config_name, splits, shard_paths):
+    """
+    Build the dataset card with the config entry pointing to the uploaded parquet shards
+    and its dataset_info (features, splits, sizes), as push_to_hub writes them
+    
+    Returns:
+        CommitOperationAdd: The README.md update to commit
+    """
+    from datasets import DatasetInfo, SplitDict, SplitInfo
+    from datasets.info import DatasetInfosDict
+    from huggingface_hub import CommitOperationAdd, DatasetCard
+    from huggingface_hub.utils import EntryNotFoundError
+
+    try:
+        card = DatasetCard.load(repo_name, repo_type="dataset")
+    except EntryNotFoundError:
+        card = DatasetCard("---\n{}\n---\n")
+
+    configs = [c for c in (card.data.get('configs') or []) if c.get('config_name') != config_name]
+    configs.append({
+        'config_name': config_name,
+        'data_files': [
+            {'split': split, 'path': f"{config_name}/{split}-*"} for split in splits
+        ],
+    })
+    card.data['configs'] = configs
+
+    info = DatasetInfo(
+        config_name=config_name,
+        features=next(iter(splits.values())).features,
+        splits=SplitDict(),
+        download_size=sum(os.path.getsize(path) for path in shard_paths),
+        dataset_size=0,
+    )
+    for split_name, split in splits.items():
+        info.splits.add(SplitInfo(name=split_name, num_bytes=split.data.nbytes, num_examples=len(split)))
+        info.dataset_size += split.data.nbytes
+    DatasetInfosDict({config_name: info}).to_dataset_card_data(card.data)
+
+    return CommitOperationAdd(path_in_repo="README.md", path_or_fileobj=str(card).encode("utf-8"))
+
+
+def _stale_shard_deletions(api, repo_name, config_name, uploaded_paths):
+    """
+    List the files under <config_name>/ in the repository that the new shards don't replace,
+    they would otherwise still match the config's data_files pattern
+    
+    Returns:
+        list: CommitOperationDelete for each stale file
+    """
+    from huggingface_hub import CommitOperationDelete
+
+    return [
+        CommitOperationDelete(path_in_repo=path)
+        for path in api.list_repo_files(repo_name, repo_type="dataset")
+        if path.startswith(f"{config_name}/") and path not in uploaded_paths
+    ]
+
+
+def _write_parquet_shards(splits, config_dir):
+    """
+    Write each split as ~SHARD_BYTES parquet files, using the push_to_hub layout
+    <split>-XXXXX-of-YYYYY.parquet
+    
+    Returns:
+        list: Paths of the written shards
+    """
+    shard_paths = []
+    for split_name, split in splits.items():
+        num_shards = max(1, math.ceil(split.data.nbytes / SHARD_BYTES))
+        for index in range(num_shards):
+            shard = split.shard(num_shards=num_shards, index=index, contiguous=True)
+            shard_path = os.path.join(config_dir, f"{split_name}-{index:05d}-of-{num_shards:05d}.parquet")
+            shard.to_parquet(shard_path)
+            shard_paths.append(shard_path)
+    return shard_paths
+
+
+def _prepare_shards(splits, shard_dir, config_name):
+    """
+    Write the parquet shards of a dataset into shard_dir/<config_name>/, reusing the shards
+    left by an interrupted upload of the same dataset
+    
+    Returns:
+        list: Paths of the shards
+    """
+    fingerprint = " ".join(f"{name}:{getattr(split, '_fingerprint', '')}" for name, split in splits.items())
+    marker_path = os.path.join(shard_dir, SHARDS_MARKER)
+    config_dir = os.path.join(shard_dir, config_name)
+
+    if os.path.isfile(marker_path):
+        with open(marker_path, "r") as f:
+            if f.read().strip() == fingerprint:
+                logging.info(f"Resuming upload of config {config_name} from {shard_dir}")
+                return sorted(glob.glob(os.path.join(config_dir, "*.parquet")))
+
+    shutil.rmtree(shard_dir, ignore_errors=True)
+    os.makedirs(config_dir)
+    shard_paths = _write_parquet_shards(splits, config_dir)
+    with open(marker_path, "w") as f:
+        f.write(fingerprint)
+    logging.info(f"Wrote {len(shard_paths)} parquet shards for config {config_name}")
+    return shard_paths
+
+
+def upload_sharded_dataset(api, dataset, repo_name, config_name, shard_dir, max_workers=UPLOAD_WORKERS):
+    """
+    Upload a dataset as parquet shards under <config_name>/ in the repository.
+    Shards are uploaded concurrently in a single commit; datasets larger than
+    LARGE_DATASET_BYTES go through HfApi.upload_large_folder instead, which
+    commits in several steps and picks up where it stopped when the upload is
+    run again. The shards are written to shard_dir, which is kept until the
+    upload succeeds so an interrupted upload can resume.
+    
+    Args:
+        api (HfApi): Hugging Face API client
+        dataset (Dataset or DatasetDict): Dataset to upload
+        repo_name (str): Repository name for upload (format: username/repo_name)
+        config_name (str): Configuration name of the dataset in the repository
+        shard_dir (str): Local folder for the parquet shards
+        max_workers (int): Number of shards uploaded concurrently (default: 8)
+    """
+    from huggingface_hub import CommitOperationAdd
+
+    splits = dict(dataset) if hasattr(dataset, 'values') else {'train': dataset}
+    shard_paths = _prepare_shards(splits, shard_dir, config_name)
+    repo_paths = {path: os.path.relpath(path, shard_dir).replace(os.sep, '/') for path in shard_paths}
+
+    # Shards of a previous upload that the new ones don't overwrite are deleted, and the
+    # dataset card is updated, in the same commit as the shards when possible
+    operations = _stale_shard_deletions(api, repo_name, config_name, set(repo_paths.values()))
+    operations.append(_config_card(repo_name, config_name, splits, shard_paths))
+
+    if _dataset_nbytes(dataset) >= LARGE_DATASET_BYTES:
+        api.upload_large_folder(
+            folder_path=shard_dir,
+            repo_id=repo_name,
+            repo_type="dataset",
+            ignore_patterns=[SHARDS_MARKER],
+            num_workers=max_workers,
+        )
+    else:
+        operations = [
+            CommitOperationAdd(path_in_repo=repo_path, path_or_fileobj=path)
+            for path, repo_path in repo_paths.items()
+        ] + operations
+
+    # One commit for all shards, num_threads uploads the files in parallel
+    api.create_commit(
+        repo_id=repo_name,
+        repo_type="dataset",
+        operations=operations,
+        commit_message=f"Upload config {config_name}",
+        num_threads=max_workers,
+    )
+    shutil.rmtree(shard_dir, ignore_errors=True)
+
+
+def upload_dataset(dataset_pattern, repo_name=None):
     """
     Upload a local dataset to Hugging Face Dataset Hub
     
     Args:
         dataset_pattern (str): Dataset pattern to match datasets
         repo_name (str): Repository name for upload (format: username/repo_name). Default is the dataset folder name
-        public (bool): Whether to make the dataset public (default: False)
     """
     logging.info("Uploading datasets to Hugging Face Dataset Hub")
     logging.info(f"Loading dataset from {dataset_pattern}")
     logging.info(f"Uploading to repository {repo_name}")
 
     try:
-        from huggingface_hub import HfApi
-        api = HfApi()
+        api = get_api()
         api.dataset_info(repo_name)
         logging.info(f"Checked, repository {repo_name} exists")
     except Exception:
@@ -69,24 +244,26 @@ def upload_dataset(dataset_pattern, repo_name=None, public=False):
         logging.info("Upload cancelled by user")
         return
     from datasets import load_from_disk
-    from huggingface_hub import create_repo
 
     for dataset_path in matching_datasets:
+        config_name = os.path.basename(os.path.normpath(dataset_path))
+        # Hidden sibling of the dataset folder, not matched by later upload patterns
+        shard_dir = os.path.join(os.path.dirname(os.path.abspath(dataset_path)), f".{config_name}.upload")
         try:
             dataset = load_from_disk(dataset_path)
-            config_name = os.path.basename(os.path.normpath(dataset_path))
             
             # 上传数据集
-            dataset.push_to_hub(
-                repo_id=repo_name,
-                private=not public,
-                config_name=config_name
-            )
+            upload_sharded_dataset(api, dataset, repo_name, config_name, shard_dir)
             
             logging.info(f"Successfully uploaded dataset to {repo_name} with config {config_name}")
             
         except Exception as e:
             logging.error(f"Failed to upload dataset {dataset_path}: {str(e)}")
+            if os.path.isdir(shard_dir):
+                logging.error(
+                    f"Parquet shards were kept in {shard_dir}, run the upload again to resume "
+                    f"or delete that folder to free the space"
+                )
             continue
     
     logging.info("Dataset upload process completed")
@@ -8,8 +8,9 @@ setup(
     version="1.3.9",
     packages=find_packages(),
     install_requires=[
-        "huggingface_hub",
-        "datasets",
+        "huggingface_hub>=0.26,<1.0",
+        "datasets<5.1",
+        "hf_transfer",
     ],
     author="Haopeng Yu",
     author_email="atlasbioin4@gmail.com",
@@ -22,7 +23,7 @@ setup(
         "License :: OSI Approved :: MIT License", 
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.7",
+    python_requires=">=3.8",
     entry_points={
         'console_scripts': [
             'ahdatasets=atlas_hfdatasets.atlas_hfdatasets:main',